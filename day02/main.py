@@ -1,8 +1,8 @@
 import typing
 
 
-def extract_data() -> typing.List[str]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.List[str]:
+    with open(path, 'r') as fd:
         return [line.strip() for line in fd]
 
 
@@ -1,5 +1,10 @@
+from array import array
+import bisect
 import functools
+import itertools
+import operator
 import re
+from sys import maxsize
 import typing
 
 
@@ -23,11 +28,11 @@ class Rect:
         return f'<Rect {self.id}> [{self.left}, {self.top}, {self.width}, {self.height}]'
 
 
-def extract_data() -> typing.List[Rect]:
+def extract_data(path: str = 'input.txt') -> typing.List[Rect]:
     pattern = r'#| @ |,|: |x'
 
     ret = []
-    with open('input.txt', 'r') as fd:
+    with open(path, 'r') as fd:
         for line in fd:
             ret.append(Rect(*map(int, re.split(pattern, line.strip())[1:])))
     return ret
@@ -67,6 +72,211 @@ def non_overlap_claim(data: typing.List[Rect]) -> int:
     return list(filter(lambda x: x[1] is True, rect_status.items()))[0][0]
 
 
+Grid = typing.List[array]
+
+
+def zeros(width: int) -> array:
+    return array('l', bytes(width * array('l').itemsize))
+
+
+def integrate(rows: typing.Iterable[typing.Iterable[int]], width: int) -> Grid:
+    """
+    2D prefix sums with a zero first row and column:
+    ret[y][x] is the sum of rows[0..y-1][0..x-1].
+    """
+    ret = [zeros(width + 1)]
+    for row in rows:
+        ret.append(array('l', map(operator.add, ret[-1], itertools.accumulate(row, initial=0))))
+    return ret
+
+
+def rasterize(data: typing.List[Rect]) -> Grid:
+    """
+    Claims count of every fabric cell: ret[y][x].
+    Each claim only marks its four corners in a difference array (O(1) per claim),
+    then a single integration pass turns it into counts.
+    """
+    width = max(rect.right for rect in data) + 1
+    height = max(rect.bottom for rect in data) + 1
+    diff = [zeros(width) for _ in range(height)]
+    for rect in data:
+        diff[rect.top][rect.left] += 1
+        diff[rect.top][rect.right] -= 1
+        diff[rect.bottom][rect.left] -= 1
+        diff[rect.bottom][rect.right] += 1
+    return [row[1:] for row in integrate(diff, width)[1:]]
+
+
+def dense_claims(data: typing.List[Rect]) -> typing.Tuple[int, typing.Optional[int]]:
+    """
+    Overlapped area and id of the non-overlapping claim from one rasterization.
+    Overlapped cells are integrated once more, so every claim is checked in O(1).
+    """
+    counts = rasterize(data)
+    overlapped = integrate(([int(v > 1) for v in row] for row in counts), len(counts[0]))
+
+    def rect_overlap(rect: Rect) -> int:
+        return overlapped[rect.bottom][rect.right] - overlapped[rect.top][rect.right] - \
+            overlapped[rect.bottom][rect.left] + overlapped[rect.top][rect.left]
+
+    claim = next((rect.id for rect in data if rect_overlap(rect) == 0), None)
+    return overlapped[-1][-1], claim
+
+
+class CoverageTree:
+    """
+    Segment tree over elementary segments between sorted coordinates,
+    tracking total length covered by at least one and at least two intervals.
+    """
+    def __init__(self, coords: typing.List[int]) -> None:
+        self.coords = coords
+        size = 4 * max(1, len(coords) - 1)
+        self.count = [0] * size
+        self.once = [0] * size
+        self.twice = [0] * size
+
+    @property
+    def covered_twice(self) -> int:
+        return self.twice[1]
+
+    def add(self, low: int, high: int, value: int) -> None:
+        """
+        Add `value` covers to [low, high) interval.
+        Takes O(log n) time.
+        """
+        lo = bisect.bisect_left(self.coords, low)
+        hi = bisect.bisect_left(self.coords, high)
+        if lo < hi:
+            self._add(1, 0, len(self.coords) - 1, lo, hi, value)
+
+    def _add(self, node: int, left: int, right: int, lo: int, hi: int, value: int) -> None:
+        if hi <= left or right <= lo:
+            return
+        if lo <= left and right <= hi:
+            self.count[node] += value
+        else:
+            mid = (left + right) // 2
+            self._add(2 * node, left, mid, lo, hi, value)
+            self._add(2 * node + 1, mid, right, lo, hi, value)
+        self._pull(node, left, right)
+
+    def _pull(self, node: int, left: int, right: int) -> None:
+        full = self.coords[right] - self.coords[left]
+        leaf = right - left == 1
+        count = self.count[node]
+        if count >= 2:
+            self.once[node] = self.twice[node] = full
+        elif count == 1:
+            self.once[node] = full
+            self.twice[node] = 0 if leaf else self.once[2 * node] + self.once[2 * node + 1]
+        elif leaf:
+            self.once[node] = self.twice[node] = 0
+        else:
+            self.once[node] = self.once[2 * node] + self.once[2 * node + 1]
+            self.twice[node] = self.twice[2 * node] + self.twice[2 * node + 1]
+
+
+class MaxTree:
+    """
+    Segment tree of slot values supporting a search of any slot
+    in a range with value above a threshold.
+    """
+    EMPTY = -maxsize - 1
+
+    def __init__(self, count: int) -> None:
+        self.size = 1
+        while self.size < count:
+            self.size *= 2
+        self.values = [self.EMPTY] * (2 * self.size)
+
+    def update(self, slot: int, value: int) -> None:
+        node = slot + self.size
+        self.values[node] = value
+        node //= 2
+        while node:
+            self.values[node] = max(self.values[2 * node], self.values[2 * node + 1])
+            node //= 2
+
+    def find(self, lo: int, hi: int, threshold: int) -> int:
+        """
+        Some slot in [lo, hi) with value above `threshold`, or -1.
+        Takes O(log n) time.
+        """
+        return self._find(1, 0, self.size, lo, hi, threshold)
+
+    def _find(self, node: int, left: int, right: int, lo: int, hi: int, threshold: int) -> int:
+        if hi <= left or right <= lo or self.values[node] <= threshold:
+            return -1
+        if right - left == 1:
+            return left
+        mid = (left + right) // 2
+        ret = self._find(2 * node, left, mid, lo, hi, threshold)
+        if ret == -1:
+            ret = self._find(2 * node + 1, mid, right, lo, hi, threshold)
+        return ret
+
+
+def sweep_overlap(data: typing.List[Rect]) -> int:
+    """
+    Overlapped area by a sweep line over vertical claim edges.
+    Takes O(n log n) time and O(n) memory regardless of the fabric size.
+    """
+    events = sorted([(rect.left, 1, rect.top, rect.bottom) for rect in data] +
+                    [(rect.right, -1, rect.top, rect.bottom) for rect in data])
+    tree = CoverageTree(sorted({rect.top for rect in data} | {rect.bottom for rect in data}))
+
+    ret = 0
+    prev_x = events[0][0] if events else 0
+    for x, value, top, bottom in events:
+        ret += tree.covered_twice * (x - prev_x)
+        tree.add(top, bottom, value)
+        prev_x = x
+    return ret
+
+
+def sweep_non_overlap_claim(data: typing.List[Rect]) -> typing.Optional[int]:
+    """
+    Id of the claim which intersects no other, by a sweep line over vertical claim edges.
+    Active claims are kept in slots ordered by top with their bottoms as values,
+    so claims intersecting [top, bottom) are slots with smaller top and bottom above `top`.
+    Every claim is marked as overlapped once, so it takes O(n log n) time and O(n) memory.
+    """
+    order = sorted(range(len(data)), key=lambda i: data[i].top)
+    slots = [0] * len(data)
+    for slot, i in enumerate(order):
+        slots[i] = slot
+    tops = [data[i].top for i in order]
+
+    active = MaxTree(len(data))
+    unmarked = MaxTree(len(data))
+    overlapped = [False] * len(data)
+
+    # removals go first at the same x: claims only touching each other don't overlap
+    events = sorted([(rect.left, 1, i) for i, rect in enumerate(data)] +
+                    [(rect.right, 0, i) for i, rect in enumerate(data)])
+    for _, insert, i in events:
+        rect = data[i]
+        if not insert:
+            active.update(slots[i], MaxTree.EMPTY)
+            unmarked.update(slots[i], MaxTree.EMPTY)
+            continue
+
+        hi = bisect.bisect_left(tops, rect.bottom)
+        if active.find(0, hi, rect.top) != -1:
+            overlapped[i] = True
+            slot = unmarked.find(0, hi, rect.top)
+            while slot != -1:
+                overlapped[order[slot]] = True
+                unmarked.update(slot, MaxTree.EMPTY)
+                slot = unmarked.find(0, hi, rect.top)
+
+        active.update(slots[i], rect.bottom)
+        if not overlapped[i]:
+            unmarked.update(slots[i], rect.bottom)
+
+    return next((rect.id for rect, o in zip(data, overlapped) if not o), None)
+
+
 if __name__ == '__main__':
     data = extract_data()
     print(claims_overlap(data))
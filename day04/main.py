@@ -58,13 +58,13 @@ def extract_asleep_schedule(
     return idx - 1, ret
 
 
-def extract_data() -> typing.List[Guard]:
+def extract_data(path: str = 'input.txt') -> typing.List[Guard]:
     pattern_dt = '^\[([^\]]+)\] ([\w\s#]+)'
     pattern_guard = r'[\w\s]+#([\d]+)[\w\s]+'
     date_format = '%Y-%m-%d %H:%M'
 
     schedule = []
-    with open('input.txt', 'r') as fd:
+    with open(path, 'r') as fd:
         for line in fd:
             m = re.match(pattern_dt, line.strip())
             dt = datetime.strptime(m.group(1), date_format)
@@ -1,14 +1,24 @@
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+from multiprocessing import shared_memory
+import os
+import typing
 from utils.linked_list import LinkedList
 
 
-def extract_data() -> LinkedList:
+def extract_data(path: str = 'input.txt') -> LinkedList:
     data = LinkedList()
-    with open('input.txt', 'r') as fd:
+    with open(path, 'r') as fd:
         for char in fd.read().strip():
             data.append(ord(char))
     return data
 
 
+def extract_polymer(path: str = 'input.txt') -> bytes:
+    with open(path, 'rb') as fd:
+        return fd.read().strip()
+
+
 def check_opposite(unit1: int, unit2: int) -> bool:
     return abs(unit1 - unit2) == 32
 
@@ -45,6 +55,84 @@ def smallest_units_count(data: LinkedList) -> int:
     return min(units.values())
 
 
+def react(polymer: bytes, stack: typing.Optional[bytearray] = None) -> bytearray:
+    """
+    Fully reacted polymer in one pass: the stack holds the reduced prefix,
+    so every unit is pushed or annihilates with the top of the stack.
+    Pass the `stack` of a previous call to continue the reaction with the next part of the polymer.
+    """
+    if stack is None:
+        stack = bytearray()
+    push, pop = stack.append, stack.pop
+    top = stack[-1] if stack else 0
+    for unit in polymer:
+        if top ^ unit == 32:
+            pop()
+            top = stack[-1] if stack else 0
+        else:
+            push(unit)
+            top = unit
+    return stack
+
+
+def stream_react(path: str = 'input.txt', chunk_size: int = 1 << 20) -> bytearray:
+    """
+    React a memory-mapped polymer file chunk by chunk.
+    Memory is bounded by the surviving stack and one chunk, not by the file size.
+    """
+    stack = bytearray()
+    if os.path.getsize(path) == 0:
+        return stack
+    with open(path, 'rb') as fd, mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start in range(0, len(mm), chunk_size):
+            react(mm[start: start + chunk_size].translate(None, b' \t\r\n'), stack)
+    return stack
+
+
+def stack_units_count(polymer: bytes) -> int:
+    return len(react(polymer))
+
+
+UPPERCASE = bytes(range(ord('A'), ord('Z') + 1))
+
+
+def stack_smallest_units_count(polymer: bytes, alphabet: bytes = UPPERCASE) -> int:
+    """
+    Removing a unit type and reacting is the same as doing it with the already reduced polymer,
+    so every filtered run starts from the result of the first reaction.
+    """
+    reduced = bytes(react(polymer))
+    return min(len(react(reduced.translate(None, bytes((unit, unit ^ 32))))) for unit in alphabet)
+
+
+def _shared_units_count(name: str, size: int, unit: int) -> int:
+    shm = shared_memory.SharedMemory(name)
+    try:
+        reduced = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+    return len(react(reduced.translate(None, bytes((unit, unit ^ 32)))))
+
+
+def parallel_smallest_units_count(polymer: bytes, alphabet: bytes = UPPERCASE,
+                                  processes: typing.Optional[int] = None) -> int:
+    """
+    The same as `stack_smallest_units_count`, but filtered runs are spread over a process pool.
+    The reduced polymer is put into shared memory once instead of being pickled for every unit.
+    """
+    reduced = react(polymer)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(reduced)))
+    try:
+        shm.buf[:len(reduced)] = reduced
+        with ProcessPoolExecutor(processes) as executor:
+            counts = executor.map(_shared_units_count, [shm.name] * len(alphabet),
+                                  [len(reduced)] * len(alphabet), alphabet)
+            return min(counts)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 if __name__ == '__main__':
     data = extract_data()
     print(units_count(data.copy()))
@@ -1,14 +1,21 @@
+import bisect
+import itertools
 import typing
 from utils.geometry import Point, Bbox
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class ManhattanPoint(Point):
     def manhattan_length(self, x: int, y: int) -> int:
         return abs(self.x - x) + abs(self.y - y)
 
 
-def extract_data() -> typing.List[ManhattanPoint]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.List[ManhattanPoint]:
+    with open(path, 'r') as fd:
         return [ManhattanPoint(*map(int, line.strip().split(', '))) for line in fd]
 
 
@@ -74,6 +81,85 @@ def specify_manhattan(data: typing.List[ManhattanPoint]) -> int:
     return ret
 
 
+def distance_chunks(data: typing.List[ManhattanPoint], chunk_rows: int = 64) -> typing.Iterator[typing.Any]:
+    """
+    Yield (first row, distances) for chunks of `chunk_rows` bounding box rows,
+    where distances[point, row, column] is the manhattan distance from the point to the cell.
+    Memory is bounded by len(data) * chunk_rows * bbox width.
+    """
+    bbox = bounding_box(data)
+    px = np.array([p.x for p in data], dtype=np.int64)
+    py = np.array([p.y for p in data], dtype=np.int64)
+    dx = np.abs(np.arange(bbox.lt.x, bbox.rb.x + 1) - px[:, None])
+    for y in range(bbox.lt.y, bbox.rb.y + 1, chunk_rows):
+        dy = np.abs(np.arange(y, min(y + chunk_rows, bbox.rb.y + 1)) - py[:, None])
+        yield y - bbox.lt.y, dy[:, :, None] + dx[:, None, :]
+
+
+def largest_area_numpy(data: typing.List[ManhattanPoint], chunk_rows: int = 64) -> int:
+    bbox = bounding_box(data)
+    areas = np.zeros(len(data), dtype=np.int64)
+    infinite = np.zeros(len(data), dtype=bool)
+
+    for row, dist in distance_chunks(data, chunk_rows):
+        owners = dist.argmin(axis=0)
+        ties = (dist == dist.min(axis=0)).sum(axis=0) > 1
+        owners[ties] = len(data)
+        areas += np.bincount(owners.ravel(), minlength=len(data) + 1)[:len(data)]
+
+        border = np.zeros(owners.shape, dtype=bool)
+        border[:, 0] = border[:, -1] = True
+        if row == 0:
+            border[0] = True
+        if row + owners.shape[0] == bbox.height:
+            border[-1] = True
+        infinite[owners[border & ~ties]] = True
+
+    return int(areas[~infinite].max())
+
+
+def specify_manhattan_numpy(data: typing.List[ManhattanPoint], limit: int = 10000, chunk_rows: int = 64) -> int:
+    return sum(int((dist.sum(axis=0) < limit).sum()) for _, dist in distance_chunks(data, chunk_rows))
+
+
+def axis_sums(coords: typing.List[int], limit: int) -> typing.List[int]:
+    """
+    Sorted distance sums along one axis for every coordinate with the sum below `limit`.
+    Outside of the points range the sum grows by len(coords) per step,
+    so only `limit // len(coords)` extra coordinates on each side are checked.
+    Each sum takes O(log n) time with sorted prefix sums.
+    """
+    coords = sorted(coords)
+    prefix = list(itertools.accumulate(coords, initial=0))
+    n = len(coords)
+    margin = limit // n + 1
+
+    ret = []
+    for c in range(coords[0] - margin, coords[-1] + margin + 1):
+        k = bisect.bisect_right(coords, c)
+        value = c * k - prefix[k] + prefix[n] - prefix[k] - c * (n - k)
+        if value < limit:
+            ret.append(value)
+    return sorted(ret)
+
+
+def safe_region_size(data: typing.List[ManhattanPoint], limit: int = 10000) -> int:
+    """
+    Count of all cells (not only inside of the bounding box) with manhattan sum below `limit`.
+    Manhattan sum is separable: sum(x) + sum(y) < limit is counted by a two-pointer sweep.
+    """
+    x_sums = axis_sums([p.x for p in data], limit)
+    y_sums = axis_sums([p.y for p in data], limit)
+
+    ret = 0
+    count = len(y_sums)
+    for x_sum in x_sums:
+        while count > 0 and x_sum + y_sums[count - 1] >= limit:
+            count -= 1
+        ret += count
+    return ret
+
+
 if __name__ == '__main__':
     data = extract_data()
     print(largest_area(data))
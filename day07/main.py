@@ -1,13 +1,13 @@
+import heapq
 import re
 import typing
-from utils.linked_list import LinkedList
 
 
-def extract_data() -> typing.List[typing.Tuple[str, str]]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.List[typing.Tuple[str, str]]:
+    with open(path, 'r') as fd:
         ret = []
         for line in fd:
-            m = re.match('Step ([A-Z]) must be finished before step ([A-Z]) can begin.', line)
+            m = re.match(r'Step (\S+) must be finished before step (\S+) can begin.', line)
             ret.append((m.group(1), m.group(2)))
         return ret
 
@@ -24,18 +24,44 @@ def task_dependencies(data: typing.List[typing.Tuple[str, str]]) -> typing.Dict[
     return dependencies
 
 
+class TaskScheduler:
+    """
+    Kahn's algorithm: tasks are released into a heap of ready tasks
+    as soon as their last dependency is completed.
+    """
+    def __init__(self, dependencies: typing.Dict[str, typing.List[str]]) -> None:
+        self.children: typing.Dict[str, typing.List[str]] = {task: [] for task in dependencies}
+        self.in_degree = {task: len(deps) for task, deps in dependencies.items()}
+        for task, deps in dependencies.items():
+            for dep in deps:
+                self.children[dep].append(task)
+        self.ready = [task for task, degree in self.in_degree.items() if degree == 0]
+        heapq.heapify(self.ready)
+
+    def has_ready(self) -> bool:
+        return len(self.ready) > 0
+
+    def pop(self) -> str:
+        """
+        Take the smallest ready task.
+        Takes O(log n) time.
+        """
+        return heapq.heappop(self.ready)
+
+    def complete(self, task: str) -> None:
+        for child in self.children[task]:
+            self.in_degree[child] -= 1
+            if self.in_degree[child] == 0:
+                heapq.heappush(self.ready, child)
+
+
 def task_order(dependencies: typing.Dict[str, typing.List[str]]) -> typing.List[str]:
     ret = []
-    resolved = set()
-    tasks = sorted(dependencies.items(), key=lambda x: x[0])
-    while tasks:
-        for idx in range(len(tasks)):
-            node, deps = tasks[idx]
-            if all(d in resolved for d in deps):
-                ret.append(node)
-                resolved.add(node)
-                tasks.pop(idx)
-                break
+    scheduler = TaskScheduler(dependencies)
+    while scheduler.has_ready():
+        task = scheduler.pop()
+        ret.append(task)
+        scheduler.complete(task)
     return ret
 
 
@@ -46,6 +72,8 @@ def workflow(data: typing.List[typing.Tuple[str, str]]) -> str:
 
 
 def task_time(task: str) -> int:
+    if len(task) != 1 or not 'A' <= task <= 'Z':
+        raise ValueError(f'No default duration for task {task!r}, pass a duration callable')
     return 61 + ord(task) - ord('A')
 
 
@@ -98,39 +126,73 @@ class WorkersPool:
         return ret
 
 
-def multiple_workflow_time(data: typing.List[typing.Tuple[str, str]]) -> int:
+def multiple_workflow_time(data: typing.List[typing.Tuple[str, str]],
+                           duration: typing.Callable[[str], int] = task_time) -> int:
     workers = WorkersPool(5)
-
-    dependencies = task_dependencies(data)
-
-    tasks = LinkedList()
-    for t in sorted(dependencies.items(), key=lambda x: x[0]):
-        tasks.append(t)
-    finished = set()
+    scheduler = TaskScheduler(task_dependencies(data))
 
     time = 0
-    while len(tasks) > 0:
-        curr = tasks.head
-        while curr is not None:
-            task, deps = curr.data
-            if all(d in finished for d in deps):
-                w = workers.get_idle_worker()
-                if w:
-                    tasks.remove_node(curr)
-                    w.set_work(task_time(task), task)
-                else:
-                    break
-            curr = curr.next
+    while True:
+        while scheduler.has_ready():
+            w = workers.get_idle_worker()
+            if not w:
+                break
+            task = scheduler.pop()
+            w.set_work(duration(task), task)
 
         idle_time = workers.time_to_idle()
+        if idle_time == 0:
+            break
         time += idle_time
         for w in workers.inc_time(idle_time):
-            finished.add(w.last_task)
+            scheduler.complete(w.last_task)
 
-    time += workers.time_to_finish()
     return time
 
 
+Timeline = typing.List[typing.Tuple[str, int, float, float]]
+
+
+def simulate_workflow(dependencies: typing.Dict[str, typing.List[str]], workers: int = 5,
+                      duration: typing.Callable[[str], float] = task_time,
+                      speeds: typing.Optional[typing.List[float]] = None) -> typing.Tuple[float, Timeline]:
+    """
+    Event-driven simulation: time jumps straight to the next task completion.
+    Ready tasks go (smallest first) to the fastest idle workers; a task takes
+    `duration(task) / speed` on a worker. Return the total time and the timeline
+    of (task, worker index, start, end).
+    """
+    if speeds is None:
+        speeds = [1] * workers
+    elif len(speeds) != workers:
+        raise ValueError(f'{len(speeds)} speeds given for {workers} workers')
+    scheduler = TaskScheduler(dependencies)
+    idle = [(-speed, idx) for idx, speed in enumerate(speeds)]
+    heapq.heapify(idle)
+    running: typing.List[typing.Tuple[float, int, str]] = []
+    timeline: Timeline = []
+
+    time = 0
+    while True:
+        while scheduler.has_ready() and idle:
+            _, worker = heapq.heappop(idle)
+            task = scheduler.pop()
+            end = time + duration(task) / speeds[worker]
+            heapq.heappush(running, (end, worker, task))
+            timeline.append((task, worker, time, end))
+
+        if not running:
+            break
+
+        time = running[0][0]
+        while running and running[0][0] == time:
+            _, worker, task = heapq.heappop(running)
+            heapq.heappush(idle, (-speeds[worker], worker))
+            scheduler.complete(task)
+
+    return time, timeline
+
+
 if __name__ == '__main__':
     data = extract_data()
     print(workflow(data))
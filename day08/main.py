@@ -1,3 +1,5 @@
+from array import array
+import itertools
 import typing
 from utils.tree import Tree, TreeNode
 
@@ -18,12 +20,27 @@ def parse_node(data: typing.List[int], start_idx: int) -> typing.Tuple[int, Tree
     return start_idx + metadata, ret
 
 
-def extract_data() -> Tree:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> Tree:
+    with open(path, 'r') as fd:
         data = list(map(int, fd.read().strip().split()))
         return Tree(parse_node(data, 0)[1])
 
 
+def read_numbers(path: str = 'input.txt', chunk_size: int = 1 << 16) -> typing.Iterator[int]:
+    """
+    Yield numbers of the file reading it by `chunk_size` bytes.
+    A number cut by the chunk end is carried over to the next chunk.
+    """
+    with open(path, 'rb') as fd:
+        tail = b''
+        for chunk in iter(lambda: fd.read(chunk_size), b''):
+            tokens = (tail + chunk).split()
+            tail = tokens.pop() if tokens and not chunk[-1:].isspace() else b''
+            yield from map(int, tokens)
+        if tail:
+            yield int(tail)
+
+
 def node_metadata(node: TreeNode) -> int:
     return sum(node.data) + sum([node_metadata(child) for child in node.children])
 
@@ -45,6 +62,117 @@ def root_value(data: Tree) -> int:
     return node_value(data.root)
 
 
+def stream_parse(numbers: typing.Iterable[int]) -> typing.Tuple[int, int]:
+    """
+    Metadata sum and root value in one pass over the numbers, without building nodes.
+    The stack holds [children left, metadata count, child values] of every open node.
+    """
+    numbers = iter(numbers)
+    total = 0
+    stack = [[next(numbers), next(numbers), []]]
+    while True:
+        frame = stack[-1]
+        if frame[0] > 0:
+            frame[0] -= 1
+            stack.append([next(numbers), next(numbers), []])
+            continue
+
+        metadata = list(itertools.islice(numbers, frame[1]))
+        children = frame[2]
+        metadata_sum = sum(metadata)
+        total += metadata_sum
+        value = sum(children[v - 1] for v in metadata if 0 < v <= len(children)) if children else metadata_sum
+
+        stack.pop()
+        if not stack:
+            return total, value
+        stack[-1][2].append(value)
+
+
+def stream_license(path: str = 'input.txt') -> typing.Tuple[int, int]:
+    return stream_parse(read_numbers(path))
+
+
+class FlatTree:
+    """
+    Struct-of-arrays tree with nodes numbered in preorder (root is 0).
+    Children of node `i` are `children[child_offsets[i]: child_offsets[i + 1]]`,
+    its metadata is `metadata[metadata_start[i]: metadata_start[i] + metadata_count[i]]`.
+    """
+    def __init__(self) -> None:
+        self.parent = array('l')
+        self.children = array('l')
+        self.child_offsets = array('l', [0])
+        self.metadata = array('l')
+        self.metadata_start = array('l')
+        self.metadata_count = array('l')
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def node_children(self, node: int) -> array:
+        return self.children[self.child_offsets[node]: self.child_offsets[node + 1]]
+
+    def node_metadata(self, node: int) -> array:
+        start = self.metadata_start[node]
+        return self.metadata[start: start + self.metadata_count[node]]
+
+    def metadata_sum(self) -> int:
+        return sum(self.metadata)
+
+    def root_value(self) -> int:
+        """
+        Children always follow their parent in preorder,
+        so values are computed in a single reversed pass.
+        """
+        values = array('q', [0]) * len(self)
+        for node in range(len(self) - 1, -1, -1):
+            children = self.node_children(node)
+            metadata = self.node_metadata(node)
+            if children:
+                values[node] = sum(values[children[v - 1]] for v in metadata if 0 < v <= len(children))
+            else:
+                values[node] = sum(metadata)
+        return values[0]
+
+
+def parse_flat(numbers: typing.Iterable[int]) -> FlatTree:
+    """
+    Iterative parse into a `FlatTree`.
+    The stack holds [node, children left] of every open node.
+    """
+    numbers = iter(numbers)
+    tree = FlatTree()
+
+    def open_node(parent: int) -> typing.List[int]:
+        node = len(tree.parent)
+        tree.parent.append(parent)
+        children = next(numbers)
+        tree.child_offsets.append(tree.child_offsets[-1] + children)
+        tree.metadata_count.append(next(numbers))
+        tree.metadata_start.append(0)
+        return [node, children]
+
+    stack = [open_node(-1)]
+    while stack:
+        frame = stack[-1]
+        if frame[1] > 0:
+            frame[1] -= 1
+            stack.append(open_node(frame[0]))
+        else:
+            tree.metadata_start[frame[0]] = len(tree.metadata)
+            tree.metadata.extend(itertools.islice(numbers, tree.metadata_count[frame[0]]))
+            stack.pop()
+
+    filled = array('l', tree.child_offsets[:-1])
+    tree.children = array('l', [0]) * (len(tree) - 1)
+    for node in range(1, len(tree)):
+        parent = tree.parent[node]
+        tree.children[filled[parent]] = node
+        filled[parent] += 1
+    return tree
+
+
 if __name__ == '__main__':
     data = extract_data()
     print(metadata_sum(data))
@@ -1,6 +1,12 @@
+from array import array
+import collections
+from concurrent.futures import ProcessPoolExecutor
+import os
 import re
+import shelve
+import tempfile
 import typing
-from utils.linked_list import DListNode, RoundedLinkedList
+from utils.linked_list import ArrayRoundedLinkedList
 
 
 class Player:
@@ -14,28 +20,21 @@ class Player:
 
 class Circle:
     def __init__(self) -> None:
-        self.circle = RoundedLinkedList()
+        self.circle = ArrayRoundedLinkedList()
 
     def reset(self) -> None:
-        self.circle = RoundedLinkedList()
+        self.circle = ArrayRoundedLinkedList()
         self.circle.append(0)
 
-    def find_node(self, offset: int) -> DListNode:
-        head = self.circle.head
-        while offset < 0:
-            head = head.prev
-            offset += 1
-        while offset > 0:
-            head = head.next
-            offset -= 1
-        return head
+    def find_node(self, offset: int) -> int:
+        return self.circle.move(self.circle.head, offset)
 
     def add_marble(self, number: int) -> int:
         if number % 23 == 0:
             node = self.find_node(-7)
-            self.circle.head = node.next
+            self.circle.head = self.circle.next[node]
             target_node = self.circle.remove_node(node)
-            return number + target_node.data
+            return number + self.circle.data[target_node]
         else:
             node = self.find_node(1)
             self.circle.head = self.circle.insert(number, node)
@@ -74,18 +73,163 @@ class Game:
         return str(self.circle)
 
 
-def extract_data() -> typing.Tuple[int, int]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.Tuple[int, int]:
+    with open(path, 'r') as fd:
         m = re.match('(\d+) players; last marble is worth (\d+) points', fd.read())
         return int(m.group(1)), int(m.group(2))
 
 
-def play(players: int, max_number: int) -> int:
+def play_linked_list(players: int, max_number: int) -> int:
     game = Game(players)
     game.play(max_number)
     return max(game.players, key=lambda x: x.score).score
 
 
+def removal_schedule(max_number: int) -> array:
+    """
+    Score of every 23rd marble: `schedule[k]` is scored by marble `23 * (k + 1)`.
+    The circle does not depend on the players count, and the schedule
+    for a smaller `max_number` is a prefix of the schedule for a larger one.
+    The current marble is always kept at the right end of the deque,
+    so every turn is a constant number of O(1) rotations.
+    """
+    schedule = array('q')
+    circle = collections.deque([0])
+    for number in range(1, max_number + 1):
+        if number % 23 == 0:
+            circle.rotate(7)
+            schedule.append(number + circle.pop())
+            circle.rotate(-1)
+        else:
+            circle.rotate(-1)
+            circle.append(number)
+    return schedule
+
+
+# marbles are handles into array('i') links of `compact_removal_schedule`
+MAX_COMPACT_MARBLES = 2 ** 31 - 1
+
+
+def compact_removal_schedule(max_number: int) -> array:
+    """
+    The same as `removal_schedule` with the circle as array('i') next/prev links:
+    every marble is placed once, so its number is its own handle and needs no data.
+    Takes 8 bytes per marble (against ~36 of the deque) and O(max_number) time.
+    """
+    if max_number > MAX_COMPACT_MARBLES:
+        raise ValueError(f'Too many marbles for a compact schedule: {max_number} > {MAX_COMPACT_MARBLES}')
+
+    next_marble = array('i', [0]) * (max_number + 1)
+    prev_marble = array('i', [0]) * (max_number + 1)
+    schedule = array('q')
+    current = 0
+    for number in range(1, max_number + 1):
+        if number % 23 == 0:
+            for _ in range(7):
+                current = prev_marble[current]
+            schedule.append(number + current)
+            before, after = prev_marble[current], next_marble[current]
+            next_marble[before] = after
+            prev_marble[after] = before
+            current = after
+        else:
+            before = next_marble[current]
+            after = next_marble[before]
+            next_marble[before] = number
+            prev_marble[number] = before
+            next_marble[number] = after
+            prev_marble[after] = number
+            current = number
+    return schedule
+
+
+def schedule_high_score(schedule: array, players: int, max_number: int) -> int:
+    scores = [0] * players
+    for idx in range(max_number // 23):
+        scores[(23 * idx + 22) % players] += schedule[idx]
+    return max(scores)
+
+
+def play_deque(players: int, max_number: int) -> int:
+    return schedule_high_score(removal_schedule(max_number), players, max_number)
+
+
+ENGINES: typing.Dict[str, typing.Callable[[int, int], int]] = {
+    'linked_list': play_linked_list,
+    'deque': play_deque,
+}
+
+
+def play(players: int, max_number: int, engine: str = 'linked_list') -> int:
+    return ENGINES[engine](players, max_number)
+
+
+_batch_schedule = array('q')
+
+
+def _init_batch(schedule_path: str) -> None:
+    global _batch_schedule
+    _batch_schedule = array('q')
+    with open(schedule_path, 'rb') as fd:
+        _batch_schedule.fromfile(fd, os.path.getsize(schedule_path) // _batch_schedule.itemsize)
+
+
+def _batch_game(game: typing.Tuple[int, int]) -> int:
+    return schedule_high_score(_batch_schedule, *game)
+
+
+def _cache_key(game: typing.Tuple[int, int]) -> str:
+    return f'{game[0]}:{game[1]}'
+
+
+def stored_schedule(max_number: int, directory: str, prefix: str = 'day09') -> str:
+    """
+    Path of the removal schedule file for `max_number` in `directory`, built if it does not exist yet.
+    """
+    path = os.path.join(directory, f'{prefix}.schedule-{max_number}.bin')
+    if not os.path.exists(path):
+        with open(path + '.tmp', 'wb') as fd:
+            compact_removal_schedule(max_number).tofile(fd)
+        os.replace(path + '.tmp', path)
+    return path
+
+
+def play_batch(games: typing.List[typing.Tuple[int, int]], processes: typing.Optional[int] = None,
+               cache_path: typing.Optional[str] = None) -> typing.List[int]:
+    """
+    High scores of many (players, max_number) games.
+    One removal schedule is built for the largest `max_number` and shared by all games,
+    which are scored in a process pool. Workers load the schedule from a file instead of
+    getting it pickled. With `cache_path` scores are cached in that shelve and the schedule
+    is kept next to it, keyed by `max_number`.
+    Building the schedule is serial: O(max_number) time and 8 bytes per marble,
+    up to `MAX_COMPACT_MARBLES`.
+    """
+    cache = shelve.open(cache_path) if cache_path is not None else {}
+    try:
+        ret = {game: cache[_cache_key(game)] for game in games if _cache_key(game) in cache}
+        pending = list({game for game in games if game not in ret})
+
+        if pending:
+            max_number = max(max_number for _, max_number in pending)
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                if cache_path is not None:
+                    directory, prefix = os.path.split(os.path.abspath(cache_path))
+                    schedule_path = stored_schedule(max_number, directory, prefix)
+                else:
+                    schedule_path = stored_schedule(max_number, tmp_dir)
+                with ProcessPoolExecutor(processes, initializer=_init_batch,
+                                         initargs=(schedule_path,)) as executor:
+                    for game, score in zip(pending, executor.map(_batch_game, pending)):
+                        ret[game] = score
+                        cache[_cache_key(game)] = score
+    finally:
+        if cache_path is not None:
+            cache.close()
+
+    return [ret[game] for game in games]
+
+
 if __name__ == '__main__':
     players, points = extract_data()
-    print(play(players, points))
+    print(play(players, points, engine='deque'))
@@ -2,6 +2,11 @@ import re
 import typing
 from utils.geometry import Point, Bbox
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Velocity(Point):
     pass
@@ -21,8 +26,8 @@ class Star:
         return f'<{self.position};{self.velocity}>'
 
 
-def extract_data() -> typing.List[Star]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.List[Star]:
+    with open(path, 'r') as fd:
         ret = []
         for line in fd:
             m = re.match('position=<([\s\d-]+),([\s\d-]+)> velocity=<([\s\d-]+),([\s\d-]+)>', line.strip())
@@ -66,6 +71,285 @@ def watch_message(data: typing.List[Star]) -> None:
         pass
 
 
+# 6x10 font of the puzzle messages
+FONT: typing.Dict[str, typing.Tuple[str, ...]] = {
+    'A': (
+        '..##..',
+        '.#..#.',
+        '#....#',
+        '#....#',
+        '#....#',
+        '######',
+        '#....#',
+        '#....#',
+        '#....#',
+        '#....#',
+    ),
+    'B': (
+        '#####.',
+        '#....#',
+        '#....#',
+        '#....#',
+        '#####.',
+        '#....#',
+        '#....#',
+        '#....#',
+        '#....#',
+        '#####.',
+    ),
+    'C': (
+        '.####.',
+        '#....#',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#....#',
+        '.####.',
+    ),
+    'E': (
+        '######',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#####.',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '######',
+    ),
+    'F': (
+        '######',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#####.',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+    ),
+    'G': (
+        '.####.',
+        '#....#',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#..###',
+        '#....#',
+        '#....#',
+        '#...##',
+        '.###.#',
+    ),
+    'H': (
+        '#....#',
+        '#....#',
+        '#....#',
+        '#....#',
+        '######',
+        '#....#',
+        '#....#',
+        '#....#',
+        '#....#',
+        '#....#',
+    ),
+    'J': (
+        '...###',
+        '....#.',
+        '....#.',
+        '....#.',
+        '....#.',
+        '....#.',
+        '....#.',
+        '#...#.',
+        '#...#.',
+        '.###..',
+    ),
+    'K': (
+        '#....#',
+        '#...#.',
+        '#..#..',
+        '#.#...',
+        '##....',
+        '##....',
+        '#.#...',
+        '#..#..',
+        '#...#.',
+        '#....#',
+    ),
+    'L': (
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '######',
+    ),
+    'N': (
+        '#....#',
+        '##...#',
+        '##...#',
+        '#.#..#',
+        '#.#..#',
+        '#..#.#',
+        '#..#.#',
+        '#...##',
+        '#...##',
+        '#....#',
+    ),
+    'P': (
+        '#####.',
+        '#....#',
+        '#....#',
+        '#....#',
+        '#####.',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+        '#.....',
+    ),
+    'R': (
+        '#####.',
+        '#....#',
+        '#....#',
+        '#....#',
+        '#####.',
+        '#..#..',
+        '#...#.',
+        '#...#.',
+        '#....#',
+        '#....#',
+    ),
+    'X': (
+        '#....#',
+        '#....#',
+        '.#..#.',
+        '.#..#.',
+        '..##..',
+        '..##..',
+        '.#..#.',
+        '.#..#.',
+        '#....#',
+        '#....#',
+    ),
+    'Z': (
+        '######',
+        '.....#',
+        '.....#',
+        '....#.',
+        '...#..',
+        '..#...',
+        '.#....',
+        '#.....',
+        '#.....',
+        '######',
+    ),
+}
+
+
+def split_glyphs(sky: typing.List[str]) -> typing.List[typing.Tuple[str, ...]]:
+    """
+    Cut the sky lines into glyphs by fully empty columns.
+    """
+    width = max(len(line) for line in sky)
+    sky = [line.ljust(width, '.') for line in sky]
+    ret = []
+    start = None
+    for x in range(width + 1):
+        if x < width and any(line[x] == '#' for line in sky):
+            if start is None:
+                start = x
+        elif start is not None:
+            ret.append(tuple(line[start: x] for line in sky))
+            start = None
+    return ret
+
+
+GLYPHS = {split_glyphs(list(glyph))[0]: letter for letter, glyph in FONT.items()}
+
+
+def recognize(sky: typing.List[str]) -> str:
+    """
+    Read the message from the sky lines, unknown glyphs become '?'.
+    """
+    return ''.join(GLYPHS.get(glyph, '?') for glyph in split_glyphs(sky))
+
+
+def star_arrays(data: typing.List[Star]) -> typing.Tuple[typing.Any, typing.Any]:
+    if np is None:
+        raise ImportError('find_message requires NumPy, use watch_message without it')
+    positions = np.array([(star.position.x, star.position.y) for star in data], dtype=np.int64)
+    velocities = np.array([(star.velocity.x, star.velocity.y) for star in data], dtype=np.int64)
+    return positions, velocities
+
+
+def sky_area(positions: typing.Any) -> int:
+    width, height = positions.max(axis=0) - positions.min(axis=0) + 1
+    return int(width) * int(height)
+
+
+def converge_time(positions: typing.Any, velocities: typing.Any) -> int:
+    """
+    Time of the smallest bounding box.
+    Spread of the stars (sum of variances) is quadratic in time,
+    its minimum -cov(p, v) / var(v) is a starting point for a descent
+    over integer times by the bounding box area.
+    """
+    p = positions - positions.mean(axis=0)
+    v = velocities - velocities.mean(axis=0)
+    speed = float((v * v).sum())
+    time = max(0, round(-float((p * v).sum()) / speed)) if speed else 0
+
+    def area(t: int) -> int:
+        return sky_area(positions + velocities * t)
+
+    current = area(time)
+    for step in (-1, 1):
+        while time + step >= 0 and area(time + step) < current:
+            time += step
+            current = area(time)
+    return time
+
+
+def render_sky(positions: typing.Any) -> typing.List[str]:
+    lt = positions.min(axis=0)
+    width, height = positions.max(axis=0) - lt + 1
+    sky = np.full((height, width), ord('.'), dtype=np.uint8)
+    shifted = positions - lt
+    sky[shifted[:, 1], shifted[:, 0]] = ord('#')
+    return [row.tobytes().decode() for row in sky]
+
+
+def find_message(data: typing.List[Star]) -> typing.Tuple[typing.List[str], int]:
+    """
+    Non-interactive `watch_message`: the converged sky lines and the time it takes.
+    """
+    positions, velocities = star_arrays(data)
+    time = converge_time(positions, velocities)
+    return render_sky(positions + velocities * time), time
+
+
+def message(data: typing.List[Star]) -> str:
+    return recognize(find_message(data)[0])
+
+
+def message_time(data: typing.List[Star]) -> int:
+    return find_message(data)[1]
+
+
 if __name__ == '__main__':
     data = extract_data()
-    watch_message(data)
+    if np is None:
+        watch_message(data)
+    else:
+        print(message(data))
+        print(message_time(data))
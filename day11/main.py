@@ -2,9 +2,14 @@ from sys import maxsize
 import typing
 from utils.geometry import Point
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def extract_data() -> int:
-    with open('input.txt', 'r') as fd:
+
+def extract_data(path: str = 'input.txt') -> int:
+    with open(path, 'r') as fd:
         return int(fd.read().strip())
 
 
@@ -67,6 +72,69 @@ def point_max_power(serial_number: int) -> typing.Tuple[Point, int]:
     return ret[0], ret[2]
 
 
+def summed_area_table(board: typing.List[typing.List[int]]) -> typing.List[typing.List[int]]:
+    w, h = len(board[0]), len(board)
+    table = [[0] * (w + 1) for _ in range(h + 1)]
+    for y in range(h):
+        row_sum = 0
+        for x in range(w):
+            row_sum += board[y][x]
+            table[y + 1][x + 1] = table[y][x + 1] + row_sum
+    return table
+
+
+def max_squares_python(serial_number: int, size: typing.Tuple[int, int]) -> typing.Tuple[int, int, int, int]:
+    w, h = size
+    table = summed_area_table(calc_board(serial_number, size))
+
+    best = (-1, -1, 0, -maxsize - 1)
+    for k in range(1, min(w, h) + 1):
+        for x in range(w - k + 1):
+            for y in range(h - k + 1):
+                power = table[y + k][x + k] - table[y][x + k] - table[y + k][x] + table[y][x]
+                if power > best[3]:
+                    best = (x, y, k, power)
+    return best
+
+
+def max_squares_numpy(serial_numbers: typing.List[int],
+                      size: typing.Tuple[int, int]) -> typing.List[typing.Tuple[int, int, int, int]]:
+    w, h = size
+    serials = np.array(serial_numbers, dtype=np.int64)[:, None, None]
+    rack_id = np.arange(w, dtype=np.int64) + 10
+    y = np.arange(h, dtype=np.int64)[:, None]
+    board = (rack_id * y + serials) * rack_id // 100 % 10 - 5
+
+    table = np.zeros((len(serial_numbers), h + 1, w + 1), dtype=np.int64)
+    table[:, 1:, 1:] = board.cumsum(axis=1).cumsum(axis=2)
+    # transposed to [serial, x, y], so argmax prefers the smallest x as the python loops do
+    table = table.transpose(0, 2, 1)
+
+    best = np.full(len(serial_numbers), -maxsize - 1, dtype=np.int64)
+    ret = [(-1, -1, 0, -maxsize - 1)] * len(serial_numbers)
+    for k in range(1, min(w, h) + 1):
+        powers = table[:, k:, k:] - table[:, :-k, k:] - table[:, k:, :-k] + table[:, :-k, :-k]
+        flat = powers.reshape(len(serial_numbers), -1)
+        indexes = flat.argmax(axis=1)
+        maximums = flat[np.arange(len(serial_numbers)), indexes]
+        for i in np.nonzero(maximums > best)[0]:
+            x, y = divmod(int(indexes[i]), powers.shape[2])
+            best[i] = maximums[i]
+            ret[i] = (x, y, k, int(maximums[i]))
+    return ret
+
+
+def max_squares(serial_numbers: typing.List[int],
+                size: typing.Tuple[int, int] = (300, 300)) -> typing.List[typing.Tuple[int, int, int, int]]:
+    """
+    (x, y, size, power) of the most powerful square of any size for every serial number.
+    The board is integrated once into a summed-area table, so every square sum takes O(1).
+    """
+    if np is not None:
+        return max_squares_numpy(serial_numbers, size)
+    return [max_squares_python(serial_number, size) for serial_number in serial_numbers]
+
+
 if __name__ == '__main__':
     data = extract_data()
     print(point_max_power3(data))
@@ -1,8 +1,14 @@
 import typing
+from utils.cycle import CycleEngine
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def extract_data() -> typing.Tuple[str, typing.Dict[str, str]]:
-    with open('input.txt', 'r') as fd:
+
+def extract_data(path: str = 'input.txt') -> typing.Tuple[str, typing.Dict[str, str]]:
+    with open(path, 'r') as fd:
         state = fd.readline().strip()[15:]
         fd.readline()
         patterns = {p: r for p, r in map(lambda x: x.strip().split(' => '), fd)}
@@ -13,36 +19,27 @@ def new_pot(state: str, patterns: typing.Dict[str, str]) -> str:
     return patterns[state]
 
 
+Plants = typing.Tuple[typing.Any, int]
+
+
+def shift_plants(target: Plants, cycle_start: Plants, cycle_end: Plants, cycles: int) -> Plants:
+    return target[0], target[1] + cycles * (cycle_end[1] - cycle_start[1])
+
+
+def string_step(plants: Plants, patterns: typing.Dict[str, str]) -> Plants:
+    state, offset = plants
+    state = f'....{state}....'
+    state = ''.join(new_pot(state[i - 2: i + 3], patterns) for i in range(2, len(state) - 2))
+    left = state.index('#')
+    right = state.rindex('#')
+    return state[left: right + 1], offset + 2 - left
+
+
 def after_n_gen(data: typing.Tuple[str, typing.Dict[str, str]], gen_count: int) -> int:
     state, patterns = data
-    offset = 0
-
-    history = {state: (0, 0)}
-    cycle_detected = False
-
-    gen = 0
-    while gen < gen_count:
-        state = f'....{state}....'
-        state = ''.join(new_pot(state[i - 2: i + 3], patterns) for i in range(2, len(state) - 2))
-        left = state.index('#')
-        right = state.rindex('#')
-        state = state[left: right + 1]
-        offset += 2 - left
-        gen += 1
-
-        if not cycle_detected:
-            if state in history:
-                history_offset, history_gen = history[state]
-                gen_diff = gen - history_gen
-                offset_diff = offset - history_offset
-
-                total_cycle = gen_count - gen // gen_diff
-                gen += total_cycle * gen_diff
-                offset += total_cycle * offset_diff
-                cycle_detected = True
-            else:
-                history[state] = (offset, gen)
-
+    engine = CycleEngine(lambda plants: string_step(plants, patterns),
+                         encode=lambda plants: plants[0], extrapolate=shift_plants)
+    state, offset = engine.run((state, 0), gen_count)
     return sum(i - offset for i, pot in enumerate(state) if pot == '#')
 
 
@@ -54,6 +51,76 @@ def after50000000000gen(data: typing.Tuple[str, typing.Dict[str, str]]) -> int:
     return after_n_gen(data, 50000000000)
 
 
+def rule_table(patterns: typing.Dict[str, str]) -> typing.List[int]:
+    """
+    Next pot by the 5-bit code of its neighbourhood, the leftmost pot is the highest bit.
+    """
+    table = [0] * 32
+    for pattern, result in patterns.items():
+        table[int(pattern.replace('#', '1').replace('.', '0'), 2)] = int(result == '#')
+    return table
+
+
+def normalize(mask: int, offset: int) -> typing.Tuple[int, int]:
+    """
+    Shift the mask so the leftmost plant is bit 0.
+    """
+    if mask == 0:
+        return 0, 0
+    shift = (mask & -mask).bit_length() - 1
+    return mask >> shift, offset + shift
+
+
+def bitset_step(mask: int, offset: int, table: typing.List[int]) -> typing.Tuple[int, int]:
+    """
+    Bit `i` of the mask is the pot `offset + i`.
+    The 5-bit window slides from the lowest bit, so the new pot `i - 2` is set by the window
+    ending at bit `i`, and the new mask starts two pots to the left.
+    """
+    digits = '01'
+    code = 0
+    ret = []
+    for bit in bin(mask)[:1:-1] + '0000':
+        code = ((code << 1) & 31) | (bit == '1')
+        ret.append(digits[table[code]])
+    return normalize(int(''.join(reversed(ret)), 2), offset - 2)
+
+
+def numpy_step(pots: typing.Any, offset: int, table: typing.Any) -> typing.Tuple[typing.Any, int]:
+    """
+    The same as `bitset_step` for a uint8 pots array: window codes are a convolution with powers of two.
+    """
+    pots = table[np.convolve(pots, [1, 2, 4, 8, 16])]
+    plants = np.flatnonzero(pots)
+    if len(plants) == 0:
+        return pots[:0], 0
+    return pots[plants[0]: plants[-1] + 1], offset - 2 + int(plants[0])
+
+
+def bitset_after_n_gen(data: typing.Tuple[str, typing.Dict[str, str]], gen_count: int,
+                       vectorized: bool = False, method: str = 'hash') -> int:
+    """
+    `after_n_gen` on a big-int bitmask (or a NumPy array with `vectorized` for wide states).
+    Normalized masks are the canonical states of the cycle engine, the offset drifts every cycle.
+    """
+    state, patterns = data
+    table = rule_table(patterns)
+    mask, offset = normalize(int(state[::-1].replace('#', '1').replace('.', '0'), 2), 0)
+
+    if vectorized:
+        table = np.array(table, dtype=np.uint8)
+        mask = np.array([int(c) for c in bin(mask)[:1:-1]], dtype=np.uint8)
+        engine = CycleEngine(lambda plants: numpy_step(*plants, table),
+                             encode=lambda plants: plants[0].tobytes(), extrapolate=shift_plants)
+        mask, offset = engine.run((mask, offset), gen_count, method)
+        return int((np.flatnonzero(mask) + offset).sum())
+
+    engine = CycleEngine(lambda plants: bitset_step(*plants, table),
+                         encode=lambda plants: plants[0], extrapolate=shift_plants)
+    mask, offset = engine.run((mask, offset), gen_count, method)
+    return sum(offset + i for i, bit in enumerate(bin(mask)[:1:-1]) if bit == '1')
+
+
 if __name__ == '__main__':
     data = extract_data()
     print(after20gen(data))
@@ -1,8 +1,8 @@
+from array import array
 from enum import Enum
 import os
 import typing
 from utils.geometry import Point
-from utils.linked_list import RoundedLinkedList
 
 
 class Direction(Enum):
@@ -11,71 +11,133 @@ class Direction(Enum):
     down = 'v'
     left = '<'
 
+    def __init__(self, symbol: str) -> None:
+        # clockwise position, the index in `CLOCKWISE`
+        self.code = '^>v<'.index(symbol)
+
     def rotate_right(self) -> 'Direction':
-        return {
-            self.up: self.right,
-            self.right: self.down,
-            self.down: self.left,
-            self.left: self.up
-        }[self]
+        return CLOCKWISE[(self.code + 1) % 4]
 
     def rotate_left(self) -> 'Direction':
-        return {
-            self.up: self.left,
-            self.left: self.down,
-            self.down: self.right,
-            self.right: self.up
-        }[self]
+        return CLOCKWISE[(self.code + 3) % 4]
 
     @property
     def trail(self) -> str:
-        return {
-            self.up: '|',
-            self.right: '-',
-            self.down: '|',
-            self.left: '-'
-        }[self]
+        return '|-|-'[self.code]
+
+
+# direction codes are clockwise: up, right, down, left
+CLOCKWISE = tuple(Direction)
+DX = (0, 1, 0, -1)
+DY = (-1, 0, 1, 0)
+# track codes: 0 is straight (or empty), the rest turn carts
+TRACK_CODES = {'/': 1, '\\': 2, '+': 3}
+
+
+def compile_transitions() -> typing.Tuple[typing.Tuple[int, int], ...]:
+    """
+    (new direction, new turn counter) by `(track * 4 + direction) * 3 + turn`.
+    Intersections turn left, go straight and turn right by the turn counter.
+    """
+    ret = []
+    for track in range(4):
+        for direction in range(4):
+            for turn in range(3):
+                if track == 1:
+                    ret.append(((1, 0, 3, 2)[direction], turn))
+                elif track == 2:
+                    ret.append(((3, 2, 1, 0)[direction], turn))
+                elif track == 3:
+                    ret.append(((direction + turn - 1) % 4, (turn + 1) % 3))
+                else:
+                    ret.append((direction, turn))
+    return tuple(ret)
+
+
+TRANSITIONS = compile_transitions()
+
+
+class CartStore:
+    """
+    Struct-of-arrays carts: parallel columns of x, y, direction code and turn counter (mod 3).
+    """
+    def __init__(self) -> None:
+        self.x = array('i')
+        self.y = array('i')
+        self.direction = array('i')
+        self.turn = array('i')
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def add(self, x: int, y: int, direction: int, turn: int = 0) -> int:
+        self.x.append(x)
+        self.y.append(y)
+        self.direction.append(direction)
+        self.turn.append(turn)
+        return len(self.x) - 1
+
+    def move(self, idx: int) -> None:
+        self.x[idx] += DX[self.direction[idx]]
+        self.y[idx] += DY[self.direction[idx]]
+
+    def change_direction(self, idx: int, track: int = 3) -> None:
+        self.direction[idx], self.turn[idx] = TRANSITIONS[(track * 4 + self.direction[idx]) * 3 + self.turn[idx]]
+
+    def advance(self, idx: int, track: bytearray, width: int) -> int:
+        """
+        Move the cart one cell and turn it by the compiled `track` codes.
+        Return its new cell index.
+        """
+        direction = self.direction[idx]
+        x = self.x[idx] + DX[direction]
+        y = self.y[idx] + DY[direction]
+        self.x[idx], self.y[idx] = x, y
+        position = y * width + x
+        self.direction[idx], self.turn[idx] = TRANSITIONS[(track[position] * 4 + direction) * 3 + self.turn[idx]]
+        return position
 
 
 class Cart:
-    def __init__(self, point: Point, direction: Direction) -> None:
-        self.point = point
-        self.direction = direction
-        self.directions_rules = RoundedLinkedList()
-        self.directions_rules.append(0)
-        self.directions_rules.append(1)
-        self.directions_rules.append(2)
+    """
+    A view of one row of a `CartStore` (a store of its own is created if not given).
+    """
+    def __init__(self, point: Point, direction: Direction, store: typing.Optional[CartStore] = None) -> None:
+        self.store = store if store is not None else CartStore()
+        self.index = self.store.add(point.x, point.y, direction.code)
+
+    @property
+    def point(self) -> Point:
+        return Point(self.store.x[self.index], self.store.y[self.index])
+
+    @property
+    def direction(self) -> Direction:
+        return CLOCKWISE[self.store.direction[self.index]]
+
+    @direction.setter
+    def direction(self, direction: Direction) -> None:
+        self.store.direction[self.index] = direction.code
 
     def __repr__(self) -> str:
         return f'<Cart: {repr(self.point)} {repr(self.direction.value)}>'
 
     def move(self) -> None:
-        if self.direction == Direction.left:
-            self.point.x -= 1
-        elif self.direction == Direction.right:
-            self.point.x += 1
-        elif self.direction == Direction.up:
-            self.point.y -= 1
-        elif self.direction == Direction.down:
-            self.point.y += 1
+        self.store.move(self.index)
 
     def change_direction(self) -> None:
-        if self.directions_rules.head.data == 0:
-            self.direction = self.direction.rotate_left()
-        elif self.directions_rules.head.data == 2:
-            self.direction = self.direction.rotate_right()
-        self.directions_rules.head = self.directions_rules.head.next
+        self.store.change_direction(self.index)
 
 
 class Map:
     def __init__(self, data: typing.List[typing.List[str]]) -> None:
         self.map = data
+        self.store = CartStore()
         self.carts: typing.List[Cart] = []
         directions = [v.value for v in Direction]
         for y, line in enumerate(data):
             for x, v in enumerate(line):
                 if v in directions:
-                    cart = Cart(Point(x, y), Direction(v))
+                    cart = Cart(Point(x, y), Direction(v), self.store)
                     self.map[y][x] = cart.direction.trail
                     self.carts.append(cart)
 
@@ -83,11 +145,11 @@ class Map:
         m = Map([])
         m.map = self.map.copy()
         for cart in self.carts:
-            m.carts.append(Cart(Point(cart.point.x, cart.point.y), Direction(cart.direction)))
+            m.carts.append(Cart(cart.point, cart.direction, m.store))
         return m
 
     def point_index(self, cart: Cart) -> int:
-        return cart.point.y * len(self.map[0]) + cart.point.x
+        return cart.store.y[cart.index] * len(self.map[0]) + cart.store.x[cart.index]
 
     def update_cart_direction(self, cart: Cart) -> None:
         x, y = cart.point.x, cart.point.y
@@ -138,8 +200,77 @@ class Map:
         return os.linesep.join([''.join(line) for line in self.map])
 
 
-def extract_data() -> Map:
-    with open('input.txt', 'r') as fd:
+class CartSimulation:
+    """
+    Carts live in a `CartStore` and an occupancy dict of cell indexes, so a crash check is O(1).
+    Crashed carts are tombstoned and dropped when the next tick order is built.
+    """
+    def __init__(self, data: Map) -> None:
+        self.width = max(len(line) for line in data.map) + 1
+        self.track = bytearray(self.width * len(data.map))
+        for y, line in enumerate(data.map):
+            for x, v in enumerate(line):
+                self.track[y * self.width + x] = TRACK_CODES.get(v, 0)
+
+        self.carts = CartStore()
+        for cart in data.carts:
+            self.carts.add(cart.point.x, cart.point.y, cart.direction.code, cart.store.turn[cart.index])
+        self.alive = [True] * len(self.carts)
+        self.alive_count = len(self.carts)
+        self.occupancy = {self.position(idx): idx for idx in range(len(self.carts))}
+
+    def position(self, idx: int) -> int:
+        return self.carts.y[idx] * self.width + self.carts.x[idx]
+
+    def point(self, position: int) -> Point:
+        y, x = divmod(position, self.width)
+        return Point(x, y)
+
+    def tick(self, remove_crashed: bool) -> typing.Optional[int]:
+        """
+        Move every cart once in the reading order.
+        Return the position of the first crash, unless crashed carts are removed.
+        Carts are moved one by one: a crash depends on which carts have already moved.
+        """
+        carts, alive, occupancy, track, width = self.carts, self.alive, self.occupancy, self.track, self.width
+
+        order = sorted((idx for idx in range(len(carts)) if alive[idx]), key=self.position)
+        for idx in order:
+            if not alive[idx]:
+                continue
+
+            del occupancy[self.position(idx)]
+            position = carts.advance(idx, track, width)
+
+            other = occupancy.get(position)
+            if other is None:
+                occupancy[position] = idx
+            elif remove_crashed:
+                del occupancy[position]
+                alive[idx] = alive[other] = False
+                self.alive_count -= 2
+            else:
+                return position
+        return None
+
+
+def fast_first_crash_position(data: Map) -> Point:
+    simulation = CartSimulation(data)
+    while True:
+        position = simulation.tick(False)
+        if position is not None:
+            return simulation.point(position)
+
+
+def fast_last_cart_position(data: Map) -> Point:
+    simulation = CartSimulation(data)
+    while simulation.alive_count > 1:
+        simulation.tick(True)
+    return simulation.point(next(simulation.position(idx) for idx, a in enumerate(simulation.alive) if a))
+
+
+def extract_data(path: str = 'input.txt') -> Map:
+    with open(path, 'r') as fd:
         return Map([[c for c in line.rstrip(os.linesep)] for line in fd])
 
 
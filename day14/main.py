@@ -1,85 +1,63 @@
-import typing
-from utils.linked_list import RoundedLinkedList
+def extract_data(path: str = 'input.txt') -> str:
+    with open(path, 'r') as fd:
+        return fd.read().strip()
 
 
-def extract_data() -> str:
-    with open('input.txt', 'r') as fd:
-        return fd.read().strip()
+class Scoreboard:
+    """
+    Recipes are stored one digit per byte, elves are indexes into the board.
+    """
+    def __init__(self) -> None:
+        self.recipes = bytearray((3, 7))
+        self.elf1 = 0
+        self.elf2 = 1
+
+    def __len__(self) -> int:
+        return len(self.recipes)
+
+    def extend(self, count: int) -> None:
+        """
+        Make at least `count` recipes.
+        """
+        recipes = self.recipes
+        elf1, elf2 = self.elf1, self.elf2
+        while len(recipes) < count:
+            score1, score2 = recipes[elf1], recipes[elf2]
+            value = score1 + score2
+            if value > 9:
+                recipes.append(1)
+                recipes.append(value - 10)
+            else:
+                recipes.append(value)
+            size = len(recipes)
+            elf1 = (elf1 + 1 + score1) % size
+            elf2 = (elf2 + 1 + score2) % size
+        self.elf1, self.elf2 = elf1, elf2
+
+    def find(self, pattern: bytes, chunk: int = 1 << 20) -> int:
+        """
+        Index of the first occurrence of `pattern` digits.
+        The board grows by `chunk` recipes, and only the new tail
+        (plus an overlap of `len(pattern) - 1`) is searched each time.
+        """
+        start = 0
+        while True:
+            self.extend(len(self.recipes) + chunk)
+            idx = self.recipes.find(pattern, start)
+            if idx != -1:
+                return idx
+            start = len(self.recipes) - len(pattern) + 1
 
 
 def ten_recipes(data: str) -> str:
     offset = int(data)
-    final_len = offset + 10
-    recipes = RoundedLinkedList()
-    elf1 = recipes.append(3)
-    elf2 = recipes.append(7)
-
-    while len(recipes) < final_len:
-        value = elf1.data + elf2.data
-        if value > 9:
-            recipes.append(value // 10)
-        recipes.append(value % 10)
-
-        for _ in range(1 + elf1.data):
-            elf1 = elf1.next
-        for _ in range(1 + elf2.data):
-            elf2 = elf2.next
-
-    ret = []
-    curr = recipes.head.prev
-    for _ in range(10):
-        ret.append(str(curr.data))
-        curr = curr.prev
-    return ''.join(reversed(ret))
-
-
-class Checker:
-    def __init__(self, data: str) -> None:
-        self.data = data
-        self.prefix = self.calc_prefix()
-        self.index = 0
-
-    def calc_prefix(self) -> typing.List[int]:
-        pattern = self.data
-        v = [0] * len(pattern)
-        for i in range(1, len(pattern)):
-            k = v[i - 1]
-            while k > 0 and pattern[k] != pattern[i]:
-                k = v[k - 1]
-            if pattern[k] == pattern[i]:
-                k = k + 1
-            v[i] = k
-        return v
-
-    def check(self, value: str) -> bool:
-        while self.index > 0 and self.data[self.index] != value:
-            self.index = self.prefix[self.index - 1]
-        if self.data[self.index] == value:
-            self.index += 1
-        if self.index == len(self.data):
-            return True
-        return False
+    scoreboard = Scoreboard()
+    scoreboard.extend(offset + 10)
+    return ''.join(map(str, scoreboard.recipes[offset: offset + 10]))
 
 
 def when_scores_occurred(data: str) -> int:
-    checker = Checker(data)
-
-    recipes = RoundedLinkedList()
-    elf1 = recipes.append(3)
-    elf2 = recipes.append(7)
-
-    while True:
-        value = elf1.data + elf2.data
-        if value > 9:
-            if checker.check(str(recipes.append(value // 10).data)):
-                return len(recipes) - len(data)
-        if checker.check(str(recipes.append(value % 10).data)):
-            return len(recipes) - len(data)
-
-        for _ in range(1 + elf1.data):
-            elf1 = elf1.next
-        for _ in range(1 + elf2.data):
-            elf2 = elf2.next
+    return Scoreboard().find(bytes(int(c) for c in data))
 
 
 if __name__ == '__main__':
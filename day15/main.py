@@ -170,8 +170,8 @@ class BattleField(SquareGrid):
         return os.linesep.join(''.join(symbol(x, y) for x in range(self.width)) for y in range(self.height))
 
 
-def extract_data() -> BattleField:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> BattleField:
+    with open(path, 'r') as fd:
         data = fd.read().splitlines(keepends=False)
         ret = BattleField(len(data[0]), len(data))
         for y, line in enumerate(data):
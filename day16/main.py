@@ -123,8 +123,8 @@ class Sample:
         return f'{repr(self.before)} -> {repr(self.instruction)} -> {repr(self.after)}'
 
 
-def extract_data() -> typing.Tuple[typing.List[Sample], typing.List[Instruction]]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.Tuple[typing.List[Sample], typing.List[Instruction]]:
+    with open(path, 'r') as fd:
         samples_raw,  instructions_raw = fd.read().split('\n\n\n')
 
         samples = []
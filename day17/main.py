@@ -114,11 +114,11 @@ class Underground:
         )
 
 
-def extract_data() -> Underground:
+def extract_data(path: str = 'input.txt') -> Underground:
     clay: typing.Set[typing.Tuple[int, int]] = set()
     bbox = Bbox()
 
-    with open('input.txt', 'r') as fd:
+    with open(path, 'r') as fd:
         for line in fd.read().splitlines(keepends=False):
             c1, c2 = line.split(', ')
             dim1, dim2 = c1[0], c2[0]
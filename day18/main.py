@@ -1,13 +1,21 @@
 from functools import partial
+from itertools import repeat
+import operator
 import typing
+from utils.cycle import CycleEngine
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 Map = typing.List[typing.List[str]]
 Point = typing.Tuple[int, int]
 
 
-def extract_data() -> Map:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> Map:
+    with open(path, 'r') as fd:
         return [[c for c in line] for line in fd.read().splitlines(keepends=False)]
 
 
@@ -53,14 +61,8 @@ def print_area(area: Map) -> None:
         print(''.join(area[y]))
 
 
-def area_hash(area: Map) -> int:
-    w, h = len(area[0]), len(area)
-    values = {'.': 0, '|': w * h, '#': w * h * w * h}
-    ret = 0
-    for y in range(h):
-        for x in range(w):
-            ret += values[area[y][x]] + y * w + x
-    return ret
+def area_code(area: Map) -> str:
+    return ''.join(''.join(line) for line in area)
 
 
 def calc_resources(area: Map) -> int:
@@ -69,34 +71,137 @@ def calc_resources(area: Map) -> int:
     return trees * lumberyards
 
 
-def resources(area: Map, steps: int) -> int:
-    area_cache: typing.Dict[int, typing.Tuple[int, Map]] = {}
-    current_diff = 0
-    valid_cycle = 0
+def resources(area: Map, steps: int, method: str = 'hash') -> int:
+    return calc_resources(CycleEngine(step, encode=area_code).run(area, steps, method))
+
+
+ACRE_CODES = {'.': 0, '|': 1, '#': 2}
+
+
+class NumpyArea:
+    """
+    The area as a uint8 array (0 open, 1 trees, 2 lumberyard) padded with open acres.
+    Neighbour counts are sums of 8 shifted views, rules are applied with boolean masks.
+    All arrays are allocated once and the two area buffers are swapped every step.
+    """
+    def __init__(self, area: Map) -> None:
+        h, w = len(area), len(area[0])
+        self.cells = np.zeros((h + 2, w + 2), dtype=np.uint8)
+        self.cells[1:-1, 1:-1] = [[ACRE_CODES[v] for v in line] for line in area]
+        self.buffer = self.cells.copy()
+        self.kind = np.zeros((h + 2, w + 2), dtype=bool)
+        self.trees = np.zeros((h, w), dtype=np.uint8)
+        self.yards = np.zeros((h, w), dtype=np.uint8)
+        self.lowest = np.zeros((h, w), dtype=np.uint8)
+        self.mask = np.zeros((h, w), dtype=bool)
+        self.rule = np.zeros((h, w), dtype=bool)
+
+    @property
+    def inner(self) -> typing.Any:
+        return self.cells[1:-1, 1:-1]
+
+    def _count(self, code: int, out: typing.Any) -> None:
+        np.equal(self.cells, code, out=self.kind)
+        kind = self.kind.view(np.uint8)
+        h, w = out.shape
+        out.fill(0)
+        for dy in range(3):
+            for dx in range(3):
+                if dy != 1 or dx != 1:
+                    np.add(out, kind[dy: dy + h, dx: dx + w], out=out)
+
+    def _apply(self, current: int, count: typing.Any, minimum: int, new: int, inverse: bool = False) -> None:
+        np.equal(self.inner, current, out=self.mask)
+        np.greater_equal(count, minimum, out=self.rule)
+        if inverse:
+            np.logical_not(self.rule, out=self.rule)
+        np.logical_and(self.mask, self.rule, out=self.mask)
+        np.copyto(self.buffer[1:-1, 1:-1], new, where=self.mask)
+
+    def step(self) -> 'NumpyArea':
+        self._count(1, self.trees)
+        self._count(2, self.yards)
+        np.minimum(self.trees, self.yards, out=self.lowest)
+
+        np.copyto(self.buffer, self.cells)
+        self._apply(0, self.trees, 3, 1)
+        self._apply(1, self.yards, 3, 2)
+        self._apply(2, self.lowest, 1, 0, inverse=True)
+        self.cells, self.buffer = self.buffer, self.cells
+        return self
+
+    def resources(self) -> int:
+        return int(np.count_nonzero(self.inner == 1)) * int(np.count_nonzero(self.inner == 2))
+
+
+def numpy_resources(area: Map, steps: int) -> int:
+    """
+    `resources` on a `NumpyArea` stepped in place, the cycle engine keeps only digests of its cells.
+    """
+    engine = CycleEngine(NumpyArea.step, encode=lambda numpy_area: numpy_area.cells.tobytes())
+    return engine.run(NumpyArea(area), steps).resources()
+
+
+ACRES = '.|#'
+# a neighbourhood sum of these weights packs trees count (low 4 bits) and lumberyards count
+ACRE_WEIGHTS = (0, 1, 16)
+
+
+def acre_table() -> bytes:
+    """
+    Next acre code by `code << 8 | trees + 16 * lumberyards` of the current acre and its neighbours.
+    """
+    table = bytearray(3 << 8)
+    for code, acre in enumerate(ACRES):
+        for trees in range(9):
+            for yards in range(9 - trees):
+                neighbors = '|' * trees + '#' * yards + '.' * (8 - trees - yards)
+                table[code << 8 | trees + 16 * yards] = ACRES.index(update_acre(acre, *neighbors))
+    return bytes(table)
+
+
+ACRE_TABLE = acre_table()
+
+
+def table_step(rows: typing.List[bytes]) -> typing.List[bytes]:
+    """
+    `step` for rows of acre codes.
+    Column sums of three weighted rows are slid by a window of three,
+    so every acre is resolved by one table lookup without building neighbours.
+    """
+    weights = [bytes(len(rows[0]) + 2)]
+    weights.extend(b'\0' + bytes(ACRE_WEIGHTS[c] for c in row) + b'\0' for row in rows)
+    weights.append(weights[0])
+
+    ret = []
+    for y, row in enumerate(rows):
+        above, middle, below = weights[y], weights[y + 1], weights[y + 2]
+        columns = list(map(operator.add, map(operator.add, above, middle), below))
+        window = map(operator.add, map(operator.add, columns[:-2], columns[1:-1]), columns[2:])
+        sums = map(operator.sub, window, middle[1:-1])
+        codes = map(operator.or_, map(operator.lshift, row, repeat(8)), sums)
+        ret.append(bytes(map(ACRE_TABLE.__getitem__, codes)))
+    return ret
+
+
+def table_resources(area: Map, steps: int, method: str = 'hash') -> int:
+    """
+    `resources` on rows of acre codes with a lookup table, without NumPy.
+    """
+    rows = [bytes(ACRES.index(v) for v in line) for line in area]
+    rows = CycleEngine(table_step, encode=b''.join).run(rows, steps, method)
+    return sum(row.count(1) for row in rows) * sum(row.count(2) for row in rows)
+
 
-    for i in range(steps):
-        h = area_hash(area)
-        if h in area_cache:
-            s, founded_area = area_cache[h]
-            diff = i - s
-            if diff == current_diff:
-                valid_cycle += 1
-                if valid_cycle:
-                    area_idx = s + (steps - i) % diff
-                    area = [a for idx, a in area_cache.values() if idx == area_idx][0]
-                    break
-            else:
-                current_diff = diff
-        else:
-            valid_cycle = 0
-            area_cache[h] = i, area
+def resources10(area: Map) -> int:
+    return resources(area, 10)
 
-        area = step(area)
 
-    return calc_resources(area)
+def resources1000000000(area: Map) -> int:
+    return resources(area, 1000000000)
 
 
 if __name__ == '__main__':
     data = extract_data()
-    print(resources(data, 10))
-    print(resources(data, 1000000000))
+    print(resources10(data))
+    print(resources1000000000(data))
@@ -137,8 +137,8 @@ class Cpu:
         return f'<CPU state: {repr(self.registers)} ip: {self.ip_index}>'
 
 
-def extract_data() -> typing.Tuple[int, typing.List[Instruction]]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.Tuple[int, typing.List[Instruction]]:
+    with open(path, 'r') as fd:
         ip_index = int(fd.readline().strip().split()[1])
         instructions: typing.List[Instruction] = []
         for line in fd:
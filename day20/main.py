@@ -2,8 +2,8 @@ from collections import defaultdict
 import typing
 
 
-def extract_data() -> typing.Dict[typing.Tuple[int, int], int]:
-    with open('input.txt') as fd:
+def extract_data(path: str = 'input.txt') -> typing.Dict[typing.Tuple[int, int], int]:
+    with open(path) as fd:
         regex = fd.readline().rstrip()
 
     letter_to_move = {
@@ -31,8 +31,8 @@ class AreaRegion:
 Map = typing.List[typing.List[AreaRegion]]
 
 
-def extract_data() -> typing.Tuple[int, Point]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.Tuple[int, Point]:
+    with open(path, 'r') as fd:
         depth = int(fd.readline().strip().split(': ')[1])
         target: Point = tuple(map(int, fd.readline().strip().split(': ')[1].split(',')))
         return depth, target
@@ -21,8 +21,8 @@ class Nanobot:
         return f'<{repr(self.pos)}: {self.radius}>'
 
 
-def extract_data() -> typing.List[Nanobot]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.List[Nanobot]:
+    with open(path, 'r') as fd:
         ret = []
         for line in fd:
             pos_str, r_str, *_ = line.strip().split(', ')
@@ -55,8 +55,8 @@ def parse_units(lines: typing.List[str]) -> typing.Dict[Unit, int]:
     return ret
 
 
-def extract_data() -> typing.Tuple[Army, Army]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.Tuple[Army, Army]:
+    with open(path, 'r') as fd:
         lines = [x.strip() for x in fd]
 
     divider = lines.index('')
@@ -4,8 +4,8 @@ import typing
 Point4 = typing.Tuple[int, int, int, int]
 
 
-def extract_data() -> typing.List[Point4]:
-    with open('input.txt', 'r') as fd:
+def extract_data(path: str = 'input.txt') -> typing.List[Point4]:
+    with open(path, 'r') as fd:
         points: typing.List[Point4] = []
         for line in fd:
             points.append(tuple(map(int, line.strip().split(','))))
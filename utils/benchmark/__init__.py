@@ -0,0 +1,4 @@
+from .part import Part, PARTS
+from .runner import discover_days, run_day, run_all, write_report
+
+__all__ = Part, PARTS, discover_days, run_day, run_all, write_report,
@@ -0,0 +1,39 @@
+import argparse
+import typing
+
+from .runner import discover_days, run_all, write_report
+
+
+def parse_inputs(values: typing.List[str]) -> typing.Dict[str, str]:
+    return dict(value.split('=', 1) for value in values)
+
+
+def positive_int(value: str) -> int:
+    ret = int(value)
+    if ret < 1:
+        raise argparse.ArgumentTypeError(f'expected a positive integer, got {value}')
+    return ret
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m utils.benchmark', description='Run and time puzzle parts')
+    parser.add_argument('days', nargs='*', help='days to run (e.g. day09), all by default')
+    parser.add_argument('-i', '--input', action='append', default=[], metavar='DAY=PATH',
+                        help='use PATH as input of DAY instead of DAY/input.txt')
+    parser.add_argument('-w', '--warmup', type=int, default=0, help='untimed runs before measuring')
+    parser.add_argument('-r', '--repeat', type=positive_int, default=1, help='timed runs per part')
+    parser.add_argument('--no-memory', action='store_true', help='skip peak memory measurement')
+    parser.add_argument('-o', '--output', default='bench_output.json', help='JSON report path')
+    args = parser.parse_args()
+
+    report = run_all(args.days or discover_days(), parse_inputs(args.input),
+                     args.warmup, args.repeat, not args.no_memory)
+    write_report(report, args.output)
+
+    for day in report:
+        for part in day['parts']:
+            print(f'{day["day"]} {part["part"]}: {part["result"]} in {part["min"]:.6f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import importlib.util
+import typing
+
+
+# day10 parts are NumPy-only
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+Adapter = typing.Callable[[typing.Any], typing.Tuple[typing.Any, ...]]
+
+
+def single(data: typing.Any) -> typing.Tuple[typing.Any, ...]:
+    return data,
+
+
+def unpack(data: typing.Any) -> typing.Tuple[typing.Any, ...]:
+    return tuple(data)
+
+
+def first(data: typing.Any) -> typing.Tuple[typing.Any, ...]:
+    return data[0],
+
+
+def nothing(data: typing.Any) -> typing.Tuple[typing.Any, ...]:
+    return ()
+
+
+class Part:
+    """
+    A puzzle part: name of the function in `dayNN.main` and
+    adapter which turns the result of `extract_data` into call arguments.
+    """
+    def __init__(self, func_name: str, adapter: Adapter = single) -> None:
+        self.func_name = func_name
+        self.adapter = adapter
+
+    def __repr__(self) -> str:
+        return f'<Part {self.func_name}>'
+
+
+PARTS: typing.Dict[str, typing.List[Part]] = {
+    'day01': [Part('result'), Part('twice_reach')],
+    'day02': [Part('checksum'), Part('common')],
+    'day03': [Part('claims_overlap'), Part('non_overlap_claim')],
+    'day04': [Part('checksum'), Part('checksum2')],
+    'day05': [Part('units_count'), Part('smallest_units_count')],
+    'day06': [Part('largest_area'), Part('specify_manhattan')],
+    'day07': [Part('workflow'), Part('multiple_workflow_time')],
+    'day08': [Part('metadata_sum'), Part('root_value')],
+    'day09': [Part('play', unpack)],
+    'day10': [Part('message'), Part('message_time')] if NUMPY_AVAILABLE else [],
+    'day11': [Part('point_max_power3'), Part('point_max_power')],
+    'day12': [Part('after20gen'), Part('after50000000000gen')],
+    'day13': [Part('first_crash_position'), Part('last_cart_position')],
+    'day14': [Part('ten_recipes'), Part('when_scores_occurred')],
+    'day15': [Part('combat_outcome'), Part('clear_win_outcome')],
+    'day16': [Part('complex_sample_amount', first), Part('execute_instructions', unpack)],
+    'day17': [Part('calc_water')],
+    'day18': [Part('resources10'), Part('resources1000000000')],
+    'day19': [Part('execute_program', unpack), Part('execute_program2', unpack)],
+    'day20': [Part('furthest_room'), Part('furthest_room_more_than_10000')],
+    'day21': [Part('compiled_alg', nothing), Part('compiled_alg_max', nothing)],
+    'day22': [Part('area_risk_level', unpack), Part('min_time', unpack)],
+    'day23': [Part('in_max_range'), Part('max_in_range_point')],
+    'day24': [Part('units_lost'), Part('win_with_boost')],
+    'day25': [Part('constellations_count')],
+}
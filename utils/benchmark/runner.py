@@ -0,0 +1,121 @@
+import gc
+import importlib
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+import typing
+
+from .part import Part, PARTS
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def discover_days(root: str = ROOT) -> typing.List[str]:
+    return sorted(name for name in os.listdir(root)
+                  if re.fullmatch(r'day\d\d', name) and os.path.isfile(os.path.join(root, name, 'main.py')))
+
+
+def load_day(day: str) -> typing.Any:
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    return importlib.import_module(f'{day}.main')
+
+
+def load_data(module: typing.Any, path: str) -> typing.Any:
+    extract_data = getattr(module, 'extract_data', None)
+    return extract_data(path) if extract_data is not None else None
+
+
+def measure_time(func: typing.Callable[..., typing.Any], make_args: typing.Callable[[], tuple],
+                 warmup: int, repeat: int) -> typing.Tuple[typing.Any, typing.List[float]]:
+    """
+    Arguments are rebuilt before every call (outside of the timed region),
+    because some parts mutate the data they are given.
+    """
+    if repeat < 1:
+        raise ValueError(f'At least one timed run is required, got repeat={repeat}')
+    for _ in range(warmup):
+        func(*make_args())
+
+    result = None
+    times = []
+    for _ in range(repeat):
+        args = make_args()
+        gc.collect()
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+    return result, times
+
+
+def measure_memory(func: typing.Callable[..., typing.Any],
+                   make_args: typing.Callable[[], tuple]) -> typing.Dict[str, int]:
+    """
+    Peak traced memory during the call and the net number of memory blocks
+    still allocated after it (blocks allocated and freed inside the call are not counted).
+    """
+    args = make_args()
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'peak_memory': peak, 'retained_blocks': sys.getallocatedblocks() - blocks_before}
+
+
+def run_part(module: typing.Any, part: Part, path: str, warmup: int, repeat: int,
+             memory: bool = True) -> typing.Dict[str, typing.Any]:
+    func = getattr(module, part.func_name)
+
+    def make_args() -> tuple:
+        return part.adapter(load_data(module, path))
+
+    result, times = measure_time(func, make_args, warmup, repeat)
+    ret = {
+        'part': part.func_name,
+        'result': repr(result),
+        'times': times,
+        'min': min(times),
+        'mean': sum(times) / len(times),
+    }
+    if memory:
+        ret.update(measure_memory(func, make_args))
+    return ret
+
+
+def run_day(day: str, path: typing.Optional[str] = None, warmup: int = 0, repeat: int = 1,
+            memory: bool = True, parts: typing.Optional[typing.List[Part]] = None) -> typing.Dict[str, typing.Any]:
+    if path is None:
+        path = os.path.join(ROOT, day, 'input.txt')
+    module = load_day(day)
+    if parts is None:
+        parts = PARTS.get(day, [])
+
+    start = time.perf_counter()
+    load_data(module, path)
+    extract_time = time.perf_counter() - start
+
+    return {
+        'day': day,
+        'input': path,
+        'extract_time': extract_time,
+        'parts': [run_part(module, part, path, warmup, repeat, memory) for part in parts],
+    }
+
+
+def run_all(days: typing.Optional[typing.List[str]] = None, inputs: typing.Optional[typing.Dict[str, str]] = None,
+            warmup: int = 0, repeat: int = 1, memory: bool = True) -> typing.List[typing.Dict[str, typing.Any]]:
+    inputs = inputs or {}
+    return [run_day(day, inputs.get(day), warmup, repeat, memory) for day in days or discover_days()]
+
+
+def write_report(report: typing.List[typing.Dict[str, typing.Any]], path: str) -> None:
+    with open(path, 'w') as fd:
+        json.dump(report, fd, indent=2)
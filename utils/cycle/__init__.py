@@ -0,0 +1,3 @@
+from .cycle_engine import CycleEngine
+
+__all__ = CycleEngine,
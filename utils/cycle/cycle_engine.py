@@ -0,0 +1,122 @@
+import typing
+
+
+State = typing.Any
+Extrapolate = typing.Callable[[State, State, State, int], State]
+
+
+class CycleEngine:
+    """
+    Run `step` many times, skipping the repeating part once states start to cycle.
+
+    `encode` maps a state to its canonical form: states with equal forms evolve equally.
+    `digest` is a compact hash of the canonical form, used to find candidates.
+    `extrapolate(target, cycle_start, cycle_end, cycles)` moves `target` forward by `cycles` cycles
+    for states which drift every cycle (e.g. an offset); by default states are returned as is.
+    """
+    def __init__(self,
+                 step: typing.Callable[[State], State],
+                 encode: typing.Callable[[State], typing.Hashable] = lambda state: state,
+                 digest: typing.Callable[[typing.Hashable], int] = hash,
+                 extrapolate: typing.Optional[Extrapolate] = None) -> None:
+        self.step = step
+        self.encode = encode
+        self.digest = digest
+        self.extrapolate = extrapolate
+
+    def _fast_forward(self, target: State, cycle_start: State, cycle_end: State, cycles: int) -> State:
+        if self.extrapolate is None:
+            return target
+        return self.extrapolate(target, cycle_start, cycle_end, cycles)
+
+    def run(self, state: State, steps: int, method: str = 'hash') -> State:
+        """
+        State after `steps` steps.
+        `hash` keeps digests of visited states and replays at most two cycles after a repeat,
+        `brent` keeps O(1) states and replays at most one cycle after detection.
+        """
+        if method == 'hash':
+            return self.run_hashed(state, steps)
+        if method == 'brent':
+            return self.run_brent(state, steps)
+        raise ValueError(f'Unknown cycle detection method: {method}')
+
+    def run_hashed(self, state: State, steps: int) -> State:
+        """
+        Only digests of visited states are kept, each with its step index.
+        A repeated digest is confirmed by replaying one cycle from the current state,
+        so `step` may update states in place (then `extrapolate` gets the same object twice).
+        """
+        history = {self.digest(self.encode(state)): 0}
+
+        idx = 0
+        while idx < steps:
+            state = self.step(state)
+            idx += 1
+            encoded = self.encode(state)
+            digest = self.digest(encoded)
+            start = history.get(digest)
+            history[digest] = idx
+            if start is None:
+                continue
+
+            length = idx - start
+            cycle_start = state
+            for _ in range(min(length, steps - idx)):
+                state = self.step(state)
+                idx += 1
+            if idx == steps:
+                return state
+            if self.encode(state) != encoded:
+                history[self.digest(self.encode(state))] = idx
+                continue
+
+            cycles, remain = divmod(steps - idx, length)
+            target = state
+            for _ in range(remain):
+                target = self.step(target)
+            return self._fast_forward(target, cycle_start, state, cycles)
+
+        return state
+
+    def run_brent(self, initial: State, steps: int) -> State:
+        """
+        Brent's algorithm: the hare doubles its lead until the tortoise is met.
+        """
+        if steps == 0:
+            return initial
+
+        power = length = 1
+        tortoise, hare = initial, self.step(initial)
+        hare_idx = 1
+        while self.encode(tortoise) != self.encode(hare):
+            if hare_idx == steps:
+                return hare
+            if power == length:
+                tortoise = hare
+                power *= 2
+                length = 0
+            hare = self.step(hare)
+            hare_idx += 1
+            length += 1
+
+        tortoise = hare = initial
+        for _ in range(length):
+            hare = self.step(hare)
+        start = 0
+        while self.encode(tortoise) != self.encode(hare):
+            tortoise = self.step(tortoise)
+            hare = self.step(hare)
+            start += 1
+
+        if steps < start:
+            state = initial
+            for _ in range(steps):
+                state = self.step(state)
+            return state
+
+        cycles, remain = divmod(steps - start, length)
+        target = tortoise
+        for _ in range(remain):
+            target = self.step(target)
+        return self._fast_forward(target, tortoise, hare, cycles)
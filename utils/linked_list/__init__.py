@@ -1,6 +1,7 @@
 from .double_link_node import DListNode
 from .base_linked_list import BaseLinkedList
-from .iterators import ListIterator, RoundedListIterator
-from .lists import LinkedList, RoundedLinkedList
+from .iterators import ListIterator, RoundedListIterator, ArrayRoundedListIterator
+from .lists import LinkedList, RoundedLinkedList, ArrayRoundedLinkedList
 
-__all__ = DListNode, BaseLinkedList, ListIterator, RoundedListIterator, LinkedList, RoundedLinkedList,
+__all__ = DListNode, BaseLinkedList, ListIterator, RoundedListIterator, ArrayRoundedListIterator, \
+    LinkedList, RoundedLinkedList, ArrayRoundedLinkedList,
@@ -1,4 +1,5 @@
 from .list_iterator import ListIterator
 from .rounded_list_iterator import RoundedListIterator
+from .array_rounded_list_iterator import ArrayRoundedListIterator
 
-__all__ = ListIterator, RoundedListIterator,
+__all__ = ListIterator, RoundedListIterator, ArrayRoundedListIterator,
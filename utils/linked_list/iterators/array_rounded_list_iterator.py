@@ -0,0 +1,19 @@
+import collections.abc
+import typing
+
+from ..base_linked_list import BaseLinkedList
+
+
+class ArrayRoundedListIterator(collections.abc.Iterator):
+    def __init__(self, collection: BaseLinkedList) -> None:
+        self._collection = collection
+        self._curr = collection.head
+        self._remain = len(collection)
+
+    def __next__(self) -> typing.Any:
+        if self._remain == 0:
+            raise StopIteration()
+        node = self._curr
+        self._curr = self._collection.next[node]
+        self._remain -= 1
+        return self._collection.data[node]
@@ -1,4 +1,5 @@
 from .linked_list import LinkedList
 from .rounded_linked_list import RoundedLinkedList
+from .array_rounded_linked_list import ArrayRoundedLinkedList
 
-__all__ = LinkedList, RoundedLinkedList,
+__all__ = LinkedList, RoundedLinkedList, ArrayRoundedLinkedList,
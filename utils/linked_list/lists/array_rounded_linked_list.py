@@ -0,0 +1,158 @@
+from array import array
+import typing
+
+from ..base_linked_list import BaseLinkedList
+from ..iterators import ArrayRoundedListIterator
+
+
+class ArrayRoundedLinkedList(BaseLinkedList):
+    """
+    A circular doubly-linked list of numbers stored in flat arrays.
+    Nodes are integer handles: `data[node]`, `next[node]` and `prev[node]`
+    replace `node.data`, `node.next` and `node.prev` of `DListNode`.
+    Handles of removed nodes are chained through `next` into a free-list
+    and reused by next inserts, so the data of a removed node stays readable
+    until the next insert.
+    """
+    def __init__(self, typecode: str = 'l') -> None:
+        super().__init__()
+        self.data = array(typecode)
+        self.next = array('l')
+        self.prev = array('l')
+        self._free = -1
+        self._size = 0
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the list.
+        Takes O(n) time.
+        """
+        return f'[{", ".join(str(val) for val in self)}]'
+
+    def __iter__(self) -> typing.Iterator:
+        return ArrayRoundedListIterator(self)
+
+    def clear(self) -> None:
+        super().clear()
+        self.data = array(self.data.typecode)
+        self.next = array('l')
+        self.prev = array('l')
+        self._free = -1
+        self._size = 0
+
+    def copy(self) -> 'ArrayRoundedLinkedList':
+        ret = self.__class__(self.data.typecode)
+        for value in self:
+            ret.append(value)
+        return ret
+
+    def reserve(self, count: int) -> None:
+        """
+        Preallocate arrays for `count` nodes.
+        Takes O(count) time.
+        """
+        extra = count - len(self.data)
+        if extra > 0:
+            self.data.extend(array(self.data.typecode, bytes(extra * self.data.itemsize)))
+            self.next.extend(array('l', bytes(extra * self.next.itemsize)))
+            self.prev.extend(array('l', bytes(extra * self.prev.itemsize)))
+
+    def _new_node(self, data: typing.Any) -> int:
+        if self._free != -1:
+            node = self._free
+            self._free = self.next[node]
+        elif self._size < len(self.data):
+            node = self._size
+            self._size += 1
+        else:
+            self.data.append(data)
+            self.next.append(0)
+            self.prev.append(0)
+            self._size += 1
+            return self._size - 1
+        self.data[node] = data
+        return node
+
+    def set_single_head(self, node: int) -> int:
+        self._head = node
+        self.next[node] = node
+        self.prev[node] = node
+        self._count = 1
+        return node
+
+    def insert_after(self, node: int, after: int) -> int:
+        after_next = self.next[after]
+        self.prev[node] = after
+        self.next[node] = after_next
+        self.prev[after_next] = node
+        self.next[after] = node
+        self._count += 1
+        return node
+
+    def insert(self, data: typing.Any, after: int) -> int:
+        """
+        Insert a new element after the `after` node.
+        Takes O(1) time.
+        """
+        return self.insert_after(self._new_node(data), after)
+
+    def prepend(self, data: typing.Any) -> int:
+        """
+        Insert a new element before the head and set head to it.
+        Takes O(1) time.
+        """
+        if self._count == 0:
+            return self.set_single_head(self._new_node(data))
+        self._head = self.insert(data, self.prev[self._head])
+        return self._head
+
+    def append(self, data: typing.Any) -> int:
+        """
+        Insert a new element before the head (after the tail).
+        Takes O(1) time.
+        """
+        if self._count == 0:
+            return self.set_single_head(self._new_node(data))
+        return self.insert(data, self.prev[self._head])
+
+    def find(self, data: typing.Any) -> typing.Optional[int]:
+        """
+        Search for the first element with `data` matching.
+        Return the element or `None` if not found.
+        Takes O(n) time.
+        """
+        curr = self._head
+        for _ in range(self._count):
+            if self.data[curr] == data:
+                return curr
+            curr = self.next[curr]
+        return None
+
+    def move(self, node: int, offset: int) -> int:
+        """
+        Return the node `offset` steps after (or before, if negative) the `node`.
+        Takes O(|offset|) time.
+        """
+        links = self.next if offset > 0 else self.prev
+        for _ in range(abs(offset)):
+            node = links[node]
+        return node
+
+    def remove_node(self, node: int) -> int:
+        """
+        Unlink an element from the list and return it.
+        Takes O(1) time.
+        """
+        if self._count == 1:
+            self._head = None
+            self._count = 0
+        else:
+            node_prev, node_next = self.prev[node], self.next[node]
+            self.next[node_prev] = node_next
+            self.prev[node_next] = node_prev
+            if self._head == node:
+                self._head = node_next
+            self._count -= 1
+        self.next[node] = self._free
+        self._free = node
+        return node